@@ -0,0 +1,70 @@
+"""Benchmark da extração de domínios: caminho antigo (decodificar e splitlines) x parse_domain_lines
+
+Uso: python bench_parse.py [N] [--rounds R]
+"""
+import argparse
+import io
+import time
+import zipfile
+
+from colorama import Fore, Style
+
+from whichOne import parse_domain_lines
+
+
+def parse_domain_lines_legacy(stream, domains):
+    """Caminho antigo: decodifica o arquivo inteiro e usa splitlines"""
+    domains.update(line.strip() for line in stream.read().decode('utf-8').splitlines() if line.strip())
+    return domains
+
+def build_benchmark_zip(count, line_end="\n"):
+    """Gera em memória um ZIP sintético com `count` hostnames divididos em três arquivos"""
+    buffer = io.BytesIO()
+    per_member = count // 3
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for member in range(3):
+            lines = (f"host{i}.svc{i % 97}.zone{member}.example.com" for i in range(per_member))
+            zip_file.writestr(f"domains{member}.txt", line_end.join(lines) + line_end)
+    return buffer.getvalue()
+
+def benchmark_domain_parsing(count=1_500_000, rounds=5):
+    """Compara domínios/s dos dois caminhos sobre o mesmo ZIP sintético"""
+    print(f"{Fore.CYAN}Benchmark da extração de domínios ({count} hostnames em 3 arquivos):{Style.RESET_ALL}")
+    ok = True
+    for label, line_end in (("LF", "\n"), ("CRLF", "\r\n")):
+        content = build_benchmark_zip(count, line_end)
+        results = {}
+        for name, parser in (("antigo", parse_domain_lines_legacy), ("bytes", parse_domain_lines)):
+            best = None
+            for _ in range(rounds):
+                start = time.perf_counter()
+                domains = set()
+                with zipfile.ZipFile(io.BytesIO(content)) as zip_file:
+                    for file_name in zip_file.namelist():
+                        with zip_file.open(file_name) as file:
+                            parser(file, domains)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            results[name] = domains
+            print(f"- {label} {name}: {len(domains) / best:,.0f} domínios/s ({len(domains)} domínios, melhor de {rounds})")
+
+        if results["antigo"] != results["bytes"]:
+            print(f"{Fore.RED}Erro: Os dois caminhos produziram conjuntos de domínios diferentes ({label}).{Style.RESET_ALL}")
+            ok = False
+    return ok
+
+def positive_int(value):
+    """Converte um inteiro maior que zero (argparse)"""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"o valor deve ser maior que zero: {value}")
+    return number
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark da extração de domínios')
+    parser.add_argument('count', nargs='?', type=positive_int, default=1_500_000,
+                        help='Número de hostnames no ZIP sintético (padrão: 1500000)')
+    parser.add_argument('--rounds', type=positive_int, default=5,
+                        help='Repetições por caminho; vale a melhor (padrão: 5)')
+    args = parser.parse_args()
+    raise SystemExit(0 if benchmark_domain_parsing(args.count, args.rounds) else 1)
@@ -0,0 +1,106 @@
+"""Benchmark de escalabilidade de --cpu-workers: baixa, extrai e compara um corpus sintético
+
+Os arquivos ZIP são servidos por um servidor HTTP local, então o benchmark percorre o
+mesmo caminho de uma execução real (requests, processos, cache em disco).
+
+Uso: python bench_workers.py [--programs P] [--domains D] [--workers 1,2,4,8]
+"""
+import argparse
+import contextlib
+import functools
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from colorama import Fore, Style
+
+import whichOne
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+def build_corpus(directory, programs, domains):
+    """Grava um ZIP por programa e retorna as entradas de índice correspondentes"""
+    index = []
+    for i in range(programs):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            for member in range(2):
+                lines = (f"h{n}.svc{n % 97}.m{member}.prog{i}.example.com" for n in range(domains // 2))
+                zip_file.writestr(f"domains{member}.txt", "\n".join(lines) + "\n")
+        with open(os.path.join(directory, f"prog{i}.zip"), "wb") as f:
+            f.write(buffer.getvalue())
+        index.append({"name": f"prog{i}", "program_url": f"https://hackerone.com/prog{i}", "bounty": True})
+    return index
+
+def run_once(index, base_url, cpu_workers):
+    """Processa o corpus com o número de processos informado e retorna o tempo gasto"""
+    # Cache vazio a cada rodada: todas as execuções fazem o mesmo trabalho
+    shutil.rmtree(whichOne.OUTPUT_DIR, ignore_errors=True)
+    programs = [dict(p, URL=f"{base_url}/{p['name']}.zip") for p in index]
+    
+    start = time.perf_counter()
+    with open(os.devnull, "wb") as sink, contextlib.redirect_stdout(io.StringIO()):
+        for program in whichOne.stream_hackerone_programs(programs, only_rewards=False, cpu_workers=cpu_workers):
+            whichOne.write_program_json(program, sink)
+    return time.perf_counter() - start
+
+def benchmark_workers(programs, domains, workers, rounds):
+    work_dir = tempfile.mkdtemp(prefix="whichone-bench-")
+    corpus_dir = os.path.join(work_dir, "corpus")
+    os.makedirs(corpus_dir)
+    index = build_corpus(corpus_dir, programs, domains)
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=corpus_dir))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    
+    # Caminhos relativos de whichOne (hackerone/cache) ficam dentro do diretório temporário
+    previous_dir = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        print(f"{Fore.CYAN}Corpus: {programs} programas x {domains} domínios; núcleos disponíveis: {os.cpu_count()}{Style.RESET_ALL}")
+        baseline = None
+        for cpu_workers in workers:
+            elapsed = min(run_once(index, base_url, cpu_workers) for _ in range(rounds))
+            baseline = baseline or elapsed
+            print(f"- {cpu_workers} processo(s): {elapsed:.2f} s, {programs * domains / elapsed:,.0f} domínios/s, "
+                  f"aceleração {baseline / elapsed:.2f}x (melhor de {rounds})")
+    finally:
+        os.chdir(previous_dir)
+        server.shutdown()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def positive_int(value):
+    """Converte um inteiro maior que zero (argparse)"""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"o valor deve ser maior que zero: {value}")
+    return number
+
+def worker_list(value):
+    """Converte '1,2,4' em [1, 2, 4]"""
+    try:
+        return [positive_int(part) for part in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"lista inválida: {value} (ex: 1,2,4,8)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark de escalabilidade de --cpu-workers')
+    parser.add_argument('--programs', type=positive_int, default=48,
+                        help='Número de programas no corpus sintético (padrão: 48)')
+    parser.add_argument('--domains', type=positive_int, default=100_000,
+                        help='Domínios por programa (padrão: 100000)')
+    parser.add_argument('--workers', type=worker_list, default=[1, 2, 4, 8],
+                        help='Números de processos a comparar; 1 é o caminho sequencial (padrão: 1,2,4,8)')
+    parser.add_argument('--rounds', type=positive_int, default=3,
+                        help='Repetições por número de processos; vale a melhor (padrão: 3)')
+    args = parser.parse_args()
+    benchmark_workers(args.programs, args.domains, args.workers, args.rounds)
@@ -7,9 +7,35 @@ from colorama import init, Fore, Style
 import pytz
 import re
 import random
+import sys
 import shutil
 import zipfile
 import io
+import gzip
+import hashlib
+import math
+import socket
+import tempfile
+import textwrap
+import threading
+import time
+import uuid
+import contextlib
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # Unix
+    msvcrt = None
 
 # Inicializa o colorama
 init()
@@ -17,7 +43,15 @@ init()
 # URL do arquivo chaos-bugbounty-list.json
 CHAOS_URL = "https://chaos-data.projectdiscovery.io/index.json"
 OUTPUT_DIR = "hackerone"  # Diretório para salvar os arquivos
-CACHE_FILE = "chaos_cache.json"  # Arquivo de cache temporário
+SNAPSHOT_DIR = "chaos_snapshots"  # Diretório com os snapshots versionados do índice
+SNAPSHOT_MANIFEST = os.path.join(SNAPSHOT_DIR, "manifest.json")
+SNAPSHOT_BLOBS_DIR = os.path.join(SNAPSHOT_DIR, "blobs")
+PARSE_CHUNK_SIZE = 1 << 20  # Tamanho dos blocos lidos de cada arquivo de domínios (1 MiB)
+CACHE_MAX_SIZE = 1024 ** 3  # Orçamento padrão do diretório hackerone/cache (1 GiB)
+CACHE_MAX_AGE_DAYS = 90  # Programas sem uso há mais dias que isso saem do cache
+CACHE_LOG_KEEP = 20  # Entradas com mudanças mantidas em cada _changes.log após a compactação
+SHARD_DIR = os.path.join(OUTPUT_DIR, "shards")  # Fragmentos gerados com --shard, combinados pelo modo merge
+SERVE_CACHE_SIZE = 1024  # Número máximo de respostas mantidas no cache do modo serve
 
 # Função para formatar data
 def format_date(date_str):
@@ -139,59 +173,187 @@ def check_new_subdomains(program):
     
     return has_new_domains
 
-def download_and_compare_domains(url, program_name):
-    """Baixa e compara domínios do arquivo com versão anterior"""
+def is_current_lock_file(lock, lock_path):
+    """Verifica se o arquivo aberto ainda é o que está no caminho (não foi removido pela limpeza)"""
     try:
-        print(f"{Fore.CYAN}Baixando arquivo de domínios para {program_name}...{Style.RESET_ALL}")
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
-        # Cria diretório para cache se não existir
-        cache_dir = os.path.join(OUTPUT_DIR, "cache")
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
-        
-        # Nome do arquivo de cache para este programa
-        cache_file = os.path.join(cache_dir, f"{program_name}_domains.txt")
-        
-        # Conjunto de domínios atuais
-        current_domains = set()
-        
-        # Verifica o tipo de arquivo pela extensão da URL
-        if url.lower().endswith('.zip'):
-            # Processa arquivo ZIP
-            zip_content = io.BytesIO(response.content)
-            with zipfile.ZipFile(zip_content) as zip_file:
-                file_list = zip_file.namelist()
-                text_files = [f for f in file_list if not f.endswith(('.jpg', '.png', '.gif', '.pdf'))]
-                
-                if not text_files:
-                    print(f"{Fore.YELLOW}Aviso: Nenhum arquivo de texto encontrado no ZIP{Style.RESET_ALL}")
-                    return [], []
-                
-                for file_name in text_files:
-                    try:
-                        with zip_file.open(file_name) as file:
-                            content = file.read().decode('utf-8')
-                            for line in content.splitlines():
-                                domain = line.strip()
-                                if domain and isinstance(domain, str):
-                                    current_domains.add(domain)
-                    except Exception as e:
-                        print(f"{Fore.YELLOW}Aviso: Erro ao processar arquivo {file_name}: {e}{Style.RESET_ALL}")
-                        continue
+        return os.path.samestat(os.fstat(lock.fileno()), os.stat(lock_path))
+    except FileNotFoundError:
+        return False
+
+@contextlib.contextmanager
+def file_lock(lock_path):
+    """Lock exclusivo entre processos, liberado automaticamente se o processo morrer"""
+    while True:
+        lock = open(lock_path, "a")
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            # A limpeza do cache pode ter removido o arquivo enquanto esperávamos: tenta de novo
+            if not is_current_lock_file(lock, lock_path):
+                lock.close()
+                continue
+        elif msvcrt:
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        break
+    
+    with lock:
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+            elif msvcrt:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+def remove_unused_lock(lock_path):
+    """Remove um arquivo de lock se ninguém o estiver usando, sem esperar"""
+    # No Windows um arquivo aberto não pode ser removido: os locks ficam
+    if not fcntl or not os.path.exists(lock_path):
+        return False
+    with open(lock_path, "a") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        # Removido com o lock em mãos: quem estiver esperando percebe e abre um novo arquivo
+        if is_current_lock_file(lock, lock_path):
+            os.remove(lock_path)
+            return True
+        return False
+
+def program_lock_path(program_name):
+    """Caminho do lock usado ao atualizar o cache de um programa"""
+    lock_dir = os.path.join(OUTPUT_DIR, "cache", "locks")
+    os.makedirs(lock_dir, exist_ok=True)
+    return os.path.join(lock_dir, f"{program_name}.lock")
+
+@contextlib.contextmanager
+def atomic_write(path, mode="w"):
+    """Escreve em um arquivo temporário e o substitui atomicamente ao final"""
+    # Nome único no mesmo diretório: processos de máquinas diferentes podem compartilhar o diretório
+    fd, tmp_file = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, mode, **({} if "b" in mode else {"encoding": "utf-8"})) as f:
+            yield f
+        # mkstemp cria o arquivo só para o dono: mantém as permissões do arquivo substituído
+        os.chmod(tmp_file, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+        os.replace(tmp_file, path)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+def decode_domain_line(raw):
+    """Decodifica uma linha de domínio que contém bytes não-ASCII (IDN)"""
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw.decode('latin-1')
+
+def add_domain_block(domains, block):
+    """Adiciona ao conjunto os domínios de um bloco de linhas completas em bytes"""
+    if block.isascii():
+        # Caso comum: o bloco inteiro é ASCII e é decodificado de uma vez só
+        lines = block.decode('ascii').splitlines()
+        if b" " in block or b"\t" in block:
+            domains.update(line.strip() for line in lines)
         else:
-            # Processa arquivo de texto simples
-            try:
-                content = response.content.decode('utf-8')
-                for line in content.splitlines():
-                    domain = line.strip()
-                    if domain and isinstance(domain, str):
-                        current_domains.add(domain)
-            except UnicodeDecodeError:
-                print(f"{Fore.RED}Erro: Não foi possível decodificar o arquivo como texto{Style.RESET_ALL}")
-                return [], []
+            domains.update(lines)
+    else:
+        # Apenas as linhas com bytes não-ASCII são decodificadas individualmente;
+        # splitlines() mantém a mesma regra de quebra de linha do caso ASCII
+        for raw in block.split(b"\n"):
+            text = raw.decode('ascii') if raw.isascii() else decode_domain_line(raw)
+            domains.update(line.strip() for line in text.splitlines())
+
+def parse_domain_lines(stream, domains=None):
+    """Lê um arquivo de domínios em blocos de bytes e adiciona os domínios ao conjunto informado"""
+    if domains is None:
+        domains = set()
+    tail = b""
+    
+    while True:
+        chunk = stream.read(PARSE_CHUNK_SIZE)
+        if not chunk:
+            break
         
+        # A última linha pode estar incompleta; fica para o próximo bloco
+        buffer = tail + chunk
+        cut = buffer.rfind(b"\n") + 1
+        tail = buffer[cut:]
+        add_domain_block(domains, buffer[:cut])
+    
+    add_domain_block(domains, tail)
+    domains.discard("")
+    
+    return domains
+
+def fetch_program_domains(url):
+    """Baixa o arquivo de domínios do programa e retorna o conjunto de domínios (None se ilegível)"""
+    response = requests.get(url, timeout=30)
+    response.raise_for_status()
+    
+    # Conjunto de domínios atuais
+    current_domains = set()
+    
+    # Verifica o tipo de arquivo pela extensão da URL
+    if url.lower().endswith('.zip'):
+        # Processa arquivo ZIP
+        zip_content = io.BytesIO(response.content)
+        with zipfile.ZipFile(zip_content) as zip_file:
+            file_list = zip_file.namelist()
+            text_files = [f for f in file_list if not f.endswith(('.jpg', '.png', '.gif', '.pdf'))]
+            
+            if not text_files:
+                print(f"{Fore.YELLOW}Aviso: Nenhum arquivo de texto encontrado no ZIP{Style.RESET_ALL}")
+                return None
+            
+            for file_name in text_files:
+                try:
+                    with zip_file.open(file_name) as file:
+                        parse_domain_lines(file, current_domains)
+                except Exception as e:
+                    print(f"{Fore.YELLOW}Aviso: Erro ao processar arquivo {file_name}: {e}{Style.RESET_ALL}")
+                    continue
+    else:
+        # Processa arquivo de texto simples
+        current_domains = parse_domain_lines(io.BytesIO(response.content))
+    
+    return current_domains
+
+def write_domains_cache(cache_dir, program_name, domains):
+    """Grava a lista de domínios do programa no cache, com substituição atômica"""
+    cache_file = os.path.join(cache_dir, f"{program_name}_domains.txt")
+    with atomic_write(cache_file) as f:
+        for domain in domains:
+            f.write(f"{domain}\n")
+
+def append_change_log(cache_dir, program_name, timestamp, new_domains, removed_domains, total):
+    """Acrescenta uma entrada ao log de mudanças do programa"""
+    log_file = os.path.join(cache_dir, f"{program_name}_changes.log")
+    with open(log_file, 'a', encoding='utf-8') as f:
+        f.write(f"\n=== Mudanças em {timestamp} ===\n")
+        if new_domains:
+            f.write("\nNovos domínios:\n")
+            for domain in new_domains:
+                f.write(f"+ {domain}\n")
+        if removed_domains:
+            f.write("\nDomínios removidos:\n")
+            for domain in removed_domains:
+                f.write(f"- {domain}\n")
+        f.write(f"\nTotal atual: {total} domínios\n")
+        f.write("="*50 + "\n")
+
+def compare_with_cache(program_name, current_domains):
+    """Compara os domínios atuais com o cache anterior, atualiza o cache e registra as mudanças"""
+    # Cria diretório para cache se não existir (vários processos podem tentar ao mesmo tempo)
+    cache_dir = os.path.join(OUTPUT_DIR, "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    
+    # Nome do arquivo de cache para este programa
+    cache_file = os.path.join(cache_dir, f"{program_name}_domains.txt")
+    
+    # Leitura, comparação e gravação sob lock: outro processo pode estar tratando o mesmo programa
+    with file_lock(program_lock_path(program_name)):
         # Lê domínios anteriores do cache
         previous_domains = set()
         if os.path.exists(cache_file):
@@ -202,42 +364,39 @@ def download_and_compare_domains(url, program_name):
                 print(f"{Fore.YELLOW}Aviso: Erro ao ler cache: {e}{Style.RESET_ALL}")
         
         # Identifica novos domínios e domínios removidos
-        new_domains = current_domains - previous_domains
-        removed_domains = previous_domains - current_domains
+        current = sorted(current_domains)
+        new_domains = sorted(current_domains - previous_domains)
+        removed_domains = sorted(previous_domains - current_domains)
         
         # Salva domínios atuais no cache
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                for domain in sorted(current_domains):
-                    f.write(f"{domain}\n")
+            write_domains_cache(cache_dir, program_name, current)
         except Exception as e:
             print(f"{Fore.YELLOW}Aviso: Erro ao salvar cache: {e}{Style.RESET_ALL}")
         
         # Cria um arquivo de log com as mudanças
-        log_file = os.path.join(cache_dir, f"{program_name}_changes.log")
         try:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"\n=== Mudanças em {timestamp} ===\n")
-                if new_domains:
-                    f.write("\nNovos domínios:\n")
-                    for domain in sorted(new_domains):
-                        f.write(f"+ {domain}\n")
-                if removed_domains:
-                    f.write("\nDomínios removidos:\n")
-                    for domain in sorted(removed_domains):
-                        f.write(f"- {domain}\n")
-                f.write(f"\nTotal atual: {len(current_domains)} domínios\n")
-                f.write("="*50 + "\n")
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            append_change_log(cache_dir, program_name, timestamp, new_domains, removed_domains, len(current))
         except Exception as e:
             print(f"{Fore.YELLOW}Aviso: Erro ao salvar log de mudanças: {e}{Style.RESET_ALL}")
+    
+    print(f"{Fore.GREEN}Domínios extraídos e comparados com sucesso!{Style.RESET_ALL}")
+    print(f"- Total de domínios: {len(current)}")
+    print(f"- Novos domínios: {len(new_domains)}")
+    print(f"- Domínios removidos: {len(removed_domains)}")
+    
+    return current, new_domains, removed_domains
+
+def download_and_compare_domains(url, program_name):
+    """Baixa e compara domínios do arquivo com versão anterior"""
+    try:
+        print(f"{Fore.CYAN}Baixando arquivo de domínios para {program_name}...{Style.RESET_ALL}")
+        current_domains = fetch_program_domains(url)
+        if current_domains is None:
+            return [], [], []
         
-        print(f"{Fore.GREEN}Domínios extraídos e comparados com sucesso!{Style.RESET_ALL}")
-        print(f"- Total de domínios: {len(current_domains)}")
-        print(f"- Novos domínios: {len(new_domains)}")
-        print(f"- Domínios removidos: {len(removed_domains)}")
-        
-        return sorted(list(current_domains)), sorted(list(new_domains)), sorted(list(removed_domains))
+        return compare_with_cache(program_name, current_domains)
             
     except Exception as e:
         print(f"{Fore.RED}Erro ao baixar/processar domínios: {e}{Style.RESET_ALL}")
@@ -247,76 +406,12 @@ def download_and_extract_domains(url):
     """Baixa e extrai domínios do arquivo"""
     try:
         print(f"{Fore.CYAN}Baixando arquivo de domínios...{Style.RESET_ALL}")
-        response = requests.get(url, timeout=30)  # Adiciona timeout
-        response.raise_for_status()
+        domains = fetch_program_domains(url)
+        if domains is None:
+            return []
         
-        # Verifica o tipo de arquivo pela extensão da URL
-        if url.lower().endswith('.zip'):
-            # Processa arquivo ZIP
-            zip_content = io.BytesIO(response.content)
-            with zipfile.ZipFile(zip_content) as zip_file:
-                file_list = zip_file.namelist()
-                text_files = [f for f in file_list if not f.endswith(('.jpg', '.png', '.gif', '.pdf'))]
-                
-                if not text_files:
-                    print(f"{Fore.YELLOW}Aviso: Nenhum arquivo de texto encontrado no ZIP{Style.RESET_ALL}")
-                    return []
-                
-                domains = set()
-                for file_name in text_files:
-                    try:
-                        with zip_file.open(file_name) as file:
-                            # Tenta diferentes codificações
-                            encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-                            content = None
-                            for encoding in encodings:
-                                try:
-                                    content = file.read().decode(encoding)
-                                    break
-                                except UnicodeDecodeError:
-                                    continue
-                            
-                            if content is None:
-                                print(f"{Fore.YELLOW}Aviso: Não foi possível decodificar o arquivo {file_name}{Style.RESET_ALL}")
-                                continue
-                            
-                            for line in content.splitlines():
-                                domain = line.strip()
-                                if domain and isinstance(domain, str):
-                                    domains.add(domain)
-                    except Exception as e:
-                        print(f"{Fore.YELLOW}Aviso: Erro ao processar arquivo {file_name}: {e}{Style.RESET_ALL}")
-                        continue
-                
-                print(f"{Fore.GREEN}Domínios extraídos com sucesso!{Style.RESET_ALL}")
-                return sorted(list(domains))
-        else:
-            # Processa arquivo de texto simples
-            try:
-                # Tenta diferentes codificações
-                encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-                content = None
-                for encoding in encodings:
-                    try:
-                        content = response.content.decode(encoding)
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if content is None:
-                    print(f"{Fore.RED}Erro: Não foi possível decodificar o arquivo como texto{Style.RESET_ALL}")
-                    return []
-                
-                domains = set()
-                for line in content.splitlines():
-                    domain = line.strip()
-                    if domain and isinstance(domain, str):
-                        domains.add(domain)
-                print(f"{Fore.GREEN}Domínios extraídos com sucesso!{Style.RESET_ALL}")
-                return sorted(list(domains))
-            except Exception as e:
-                print(f"{Fore.RED}Erro ao processar arquivo de texto: {e}{Style.RESET_ALL}")
-                return []
+        print(f"{Fore.GREEN}Domínios extraídos com sucesso!{Style.RESET_ALL}")
+        return sorted(list(domains))
             
     except requests.exceptions.Timeout:
         print(f"{Fore.RED}Erro: Tempo limite excedido ao baixar o arquivo{Style.RESET_ALL}")
@@ -390,15 +485,113 @@ def extract_reward_info(program):
     
     return reward_info
 
+def load_snapshot_manifest():
+    """Lê o manifesto de snapshots (lista de capturas do índice)"""
+    if not os.path.exists(SNAPSHOT_MANIFEST):
+        return {"version": 1, "snapshots": []}
+    try:
+        with open(SNAPSHOT_MANIFEST, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"{Fore.YELLOW}Aviso: Erro ao ler manifesto de snapshots: {e}{Style.RESET_ALL}")
+        return {"version": 1, "snapshots": []}
+
+def encode_snapshot(data):
+    """Serializa o índice em NDJSON canônico (um programa por linha)"""
+    lines = [json.dumps(program, sort_keys=True, separators=(",", ":"), ensure_ascii=False) for program in data]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+def save_snapshot(data):
+    """Salva o índice como blob comprimido endereçado pelo conteúdo e registra no manifesto"""
+    payload = encode_snapshot(data)
+    digest = hashlib.sha256(payload).hexdigest()
+
+    os.makedirs(SNAPSHOT_BLOBS_DIR, exist_ok=True)
+
+    # Blobs idênticos são armazenados uma única vez
+    blob_file = os.path.join(SNAPSHOT_BLOBS_DIR, f"{digest}.ndjson.gz")
+    if not os.path.exists(blob_file):
+        with atomic_write(blob_file, "wb") as raw:
+            # mtime=0 mantém o arquivo comprimido determinístico
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+                f.write(payload)
+
+    # Várias execuções (ex: shards) podem registrar snapshots ao mesmo tempo
+    with file_lock(f"{SNAPSHOT_MANIFEST}.lock"):
+        manifest = load_snapshot_manifest()
+        manifest["snapshots"].append({
+            "fetched_at": datetime.now(pytz.UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "sha256": digest,
+            "programs": len(data),
+            "bytes": os.path.getsize(blob_file)
+        })
+
+        with atomic_write(SNAPSHOT_MANIFEST) as f:
+            json.dump(manifest, f, separators=(",", ":"))
+
+    return digest
+
+def load_snapshot(digest):
+    """Carrega um snapshot a partir do seu hash"""
+    blob_file = os.path.join(SNAPSHOT_BLOBS_DIR, f"{digest}.ndjson.gz")
+    with gzip.open(blob_file, "rb") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def find_snapshot(date_str):
+    """Retorna a entrada do manifesto mais recente capturada até a data informada"""
+    # Datas ISO em UTC podem ser comparadas como texto; comparamos só o prefixo informado
+    found = None
+    for entry in load_snapshot_manifest()["snapshots"]:
+        if entry["fetched_at"][:len(date_str)] <= date_str:
+            found = entry
+    return found
+
+def list_snapshots():
+    """Exibe os snapshots registrados no manifesto"""
+    snapshots = load_snapshot_manifest()["snapshots"]
+    if not snapshots:
+        print(f"{Fore.YELLOW}Nenhum snapshot encontrado em {SNAPSHOT_DIR}.{Style.RESET_ALL}")
+        return
+
+    print(f"{Fore.CYAN}Snapshots do índice ({len(snapshots)}):{Style.RESET_ALL}")
+    for entry in snapshots:
+        print(f"- {entry['fetched_at']}  {entry['sha256'][:12]}  {entry['programs']} programas  {entry['bytes']} bytes")
+
+    unique_blobs = {entry["sha256"] for entry in snapshots}
+    print(f"{Fore.CYAN}Blobs distintos armazenados: {len(unique_blobs)}{Style.RESET_ALL}")
+
+def diff_snapshots(start_date, end_date):
+    """Lista programas adicionados ou removidos entre dois snapshots, sem buscar dados novamente"""
+    start = find_snapshot(start_date)
+    end = find_snapshot(end_date)
+    if not start or not end:
+        missing = start_date if not start else end_date
+        print(f"{Fore.RED}Erro: Nenhum snapshot encontrado até {missing}.{Style.RESET_ALL}")
+        return None
+
+    print(f"{Fore.CYAN}Comparando snapshot {start['fetched_at']} com {end['fetched_at']}...{Style.RESET_ALL}")
+
+    if start["sha256"] == end["sha256"]:
+        added, removed = [], []
+    else:
+        old_names = {p.get("name", "") for p in load_snapshot(start["sha256"])}
+        new_names = {p.get("name", "") for p in load_snapshot(end["sha256"])}
+        added = sorted(new_names - old_names)
+        removed = sorted(old_names - new_names)
+
+    print(f"\n{Fore.GREEN}Programas adicionados ({len(added)}):{Style.RESET_ALL}")
+    for name in added:
+        print(f"  + {name}")
+    print(f"\n{Fore.RED}Programas removidos ({len(removed)}):{Style.RESET_ALL}")
+    for name in removed:
+        print(f"  - {name}")
+
+    return {"added": added, "removed": removed}
+
 def fetch_programs():
     try:
         print(f"{Fore.CYAN}Buscando dados atualizados da ProjectDiscovery...{Style.RESET_ALL}")
-        
-        # Remove o arquivo de cache antigo se existir
-        if os.path.exists(CACHE_FILE):
-            os.remove(CACHE_FILE)
-            print(f"{Fore.YELLOW}Arquivo de cache antigo removido.{Style.RESET_ALL}")
-        
+
         # Fazendo a requisição para obter o JSON atualizado
         response = requests.get(CHAOS_URL, timeout=30)  # Adiciona timeout
         response.raise_for_status()
@@ -428,13 +621,12 @@ def fetch_programs():
                 print(f"{Fore.RED}Erro ao decodificar o JSON da resposta: {e}{Style.RESET_ALL}")
                 return None
         
-        # Salva os dados atualizados em um arquivo de cache
+        # Salva os dados atualizados como snapshot versionado
         try:
-            with open(CACHE_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-            print(f"{Fore.GREEN}Cache atualizado com sucesso.{Style.RESET_ALL}")
+            digest = save_snapshot(data)
+            print(f"{Fore.GREEN}Snapshot salvo com sucesso ({digest[:12]}).{Style.RESET_ALL}")
         except Exception as e:
-            print(f"{Fore.YELLOW}Aviso: Não foi possível salvar o cache: {e}{Style.RESET_ALL}")
+            print(f"{Fore.YELLOW}Aviso: Não foi possível salvar o snapshot: {e}{Style.RESET_ALL}")
         
         return data
     except requests.exceptions.Timeout:
@@ -447,11 +639,21 @@ def fetch_programs():
         print(f"{Fore.RED}Erro inesperado: {e}{Style.RESET_ALL}")
         return None
 
+def non_negative_int(value):
+    """Converte um inteiro maior ou igual a zero (argparse)"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"número inválido: {value}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"o valor não pode ser negativo: {value}")
+    return number
+
 def parse_arguments():
     parser = argparse.ArgumentParser(description='HackerOne Program Fetcher')
     parser.add_argument('mode', nargs='?', default='all', 
-                        choices=['all', 'rewards', 'top10', 'top20', 'top50'],
-                        help='Modo de operação: all (todos os programas), rewards (apenas com recompensas), top10/20/50 (programas mais recentes)')
+                        choices=['all', 'rewards', 'top10', 'top20', 'top50', 'serve', 'merge'],
+                        help='Modo de operação: all (todos os programas), rewards (apenas com recompensas), top10/20/50 (programas mais recentes), serve (API HTTP local), merge (combinar fragmentos de --shard)')
     parser.add_argument('--all', action='store_true', 
                         help='Incluir todos os programas, mesmo sem recompensas (quando usado com top10/20/50)')
     parser.add_argument('--sort-by', choices=['launch', 'update', 'added'], default='launch',
@@ -460,89 +662,457 @@ def parse_arguments():
                         help='Filtrar por nome do programa (ex: -p Snapchat)')
     parser.add_argument('-scope', type=str,
                         help='Exibir todos os domínios do escopo de um programa específico (ex: -scope airbnb)')
+    parser.add_argument('--snapshots', action='store_true',
+                        help='Listar os snapshots do índice armazenados localmente')
+    parser.add_argument('--snapshot-diff', nargs=2, metavar=('INICIO', 'FIM'),
+                        help='Listar programas adicionados/removidos entre dois snapshots (ex: --snapshot-diff 2025-01-01 2025-02-01)')
+    parser.add_argument('--snapshot', type=str, metavar='DATA',
+                        help='Usar o snapshot armazenado até a data informada em vez de buscar o índice (ex: --snapshot 2025-01-01)')
+    parser.add_argument('--host', type=str, default='127.0.0.1',
+                        help='Endereço do servidor no modo serve (padrão: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000,
+                        help='Porta do servidor no modo serve (padrão: 8000)')
+    parser.add_argument('--serve-cache-size', type=non_negative_int, default=SERVE_CACHE_SIZE, metavar='N',
+                        help=f'Número máximo de respostas em cache no modo serve; 0 desativa (padrão: {SERVE_CACHE_SIZE})')
+    parser.add_argument('--emit-changes', nargs='?', const='-', metavar='DESTINO',
+                        help='Emitir domínios novos/removidos em NDJSON assim que cada programa é comparado; sem DESTINO usa a saída padrão (ex: --emit-changes /tmp/mudancas.fifo)')
+    parser.add_argument('--cpu-workers', type=non_negative_int, default=1, metavar='N',
+                        help='Processos para baixar, extrair e comparar os domínios em paralelo; 0 usa todos os núcleos (padrão: 1)')
+    parser.add_argument('--cache-stats', action='store_true',
+                        help='Exibir o uso do diretório de cache e o que seria removido pela limpeza')
+    parser.add_argument('--cache-gc', action='store_true',
+                        help='Remover do cache programas órfãos, expirados e menos usados, e compactar os logs de mudanças')
+    parser.add_argument('--cache-max-size', type=parse_size, default=CACHE_MAX_SIZE, metavar='TAMANHO',
+                        help='Tamanho máximo do cache, ex: 500M, 2G; 0 desativa (padrão: 1G)')
+    parser.add_argument('--cache-max-age', type=non_negative_int, default=CACHE_MAX_AGE_DAYS, metavar='DIAS',
+                        help=f'Idade máxima, em dias, de um programa sem uso no cache; 0 desativa (padrão: {CACHE_MAX_AGE_DAYS})')
+    parser.add_argument('--shard', type=parse_shard, metavar='i/N',
+                        help='Processar apenas o shard i de N (modos all/rewards) e gravar um fragmento para o modo merge (ex: --shard 2/4)')
+    parser.add_argument('--run-id', type=parse_run_id, metavar='ID',
+                        help='Identificador da execução distribuída, igual em todos os shards (padrão: hash do índice processado)')
+    parser.add_argument('--time-budget', type=parse_duration, metavar='DURAÇÃO',
+                        help='Prazo da execução (modos all/rewards), ex: 90, 30m, 2h; ao esgotar, nenhum novo download é iniciado e os restantes ficam para a próxima execução')
+    parser.add_argument('--priority', choices=['index', 'bounty', 'recent', 'change'], default='index',
+                        help='Ordem de processamento (modos all/rewards): index (ordem do índice), bounty (recompensas primeiro), recent (atualizados recentemente), change (maior número de mudanças)')
     return parser.parse_args()
 
-def filter_hackerone_rewards(data, only_rewards=True, top_count=None, program_name=None):
-    if not data:
-        print(f"{Fore.RED}Nenhum dado de programas encontrado.{Style.RESET_ALL}")
+def is_hackerone_program(program):
+    """Verifica se o programa pertence à HackerOne"""
+    return program.get("program_url", "").startswith("https://hackerone.com/")
+
+# Etapas do pipeline: cada uma consome e produz programas um de cada vez
+def ingest_programs(data, only_rewards=True, program_name=None):
+    """Seleciona os programas da HackerOne que atendem aos filtros"""
+    for program in data:
+        # Verifica se é um programa da HackerOne
+        if not is_hackerone_program(program):
+            continue
+        
+        # Se um nome de programa foi especificado, verifica se corresponde
+        if program_name and program_name.lower() not in program.get("name", "").lower():
+            continue
+        
+        # Se only_rewards for True, verifica se o programa paga recompensas
+        if not only_rewards or program.get("bounty", False):
+            # Copia o programa para que as listas de domínios não fiquem presas ao índice
+            yield dict(program)
+
+def parse_duration(value):
+    """Converte durações como 90, 45s, 30m ou 2h em segundos"""
+    units = {"s": 1, "m": 60, "h": 3600}
+    text = str(value).strip().lower()
+    try:
+        if text and text[-1] in units:
+            seconds = float(text[:-1]) * units[text[-1]]
+        else:
+            seconds = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"duração inválida: {value}")
+    # nan nunca expira e zero ou negativo adiaria todos os programas
+    if not math.isfinite(seconds) or seconds <= 0:
+        raise argparse.ArgumentTypeError(f"a duração deve ser um número finito maior que zero: {value}")
+    return seconds
+
+class RunSchedule:
+    """Ordem de processamento, prazo da execução e programas que ficaram para a próxima"""
+    def __init__(self, priority="index", time_budget=None, pending=None):
+        self.priority = priority
+        self.deadline = time.monotonic() + time_budget if time_budget is not None else None
+        self.pending = pending or []
+        self.started = set()
+        self.cancelled = []
+        self.remaining = []
+
+    def expired(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def deferred(self):
+        """Programas adiados: cancelados antes de começar e os que nem saíram da fila"""
+        return self.cancelled + self.remaining
+
+def program_priority(program, priority):
+    """Chave de prioridade do programa (maior primeiro)"""
+    try:
+        change = int(program.get("change") or 0)
+    except (TypeError, ValueError):
+        change = 0
+    last_updated = program.get("last_updated") or ""
+    
+    if priority == "bounty":
+        return (bool(program.get("bounty", False)), change, last_updated)
+    if priority == "recent":
+        return last_updated
+    if priority == "change":
+        return change
+    return 0
+
+def prioritize_programs(programs, priority="index", pending=None):
+    """Ordena os programas pela prioridade, com os pendentes da execução anterior na frente"""
+    if priority != "index":
+        programs.sort(key=lambda p: program_priority(p, priority), reverse=True)
+    if pending:
+        pending_rank = {name: i for i, name in enumerate(pending)}
+        programs.sort(key=lambda p: pending_rank.get(p.get("name", ""), len(pending_rank)))
+    return programs
+
+def schedule_programs(programs, schedule):
+    """Entrega os programas na ordem de prioridade até o fim do prazo"""
+    queue = deque(prioritize_programs(list(programs), schedule.priority, schedule.pending))
+    
+    while queue:
+        # Sem tempo: não inicia novos downloads (os que já estão em andamento terminam)
+        if schedule.expired():
+            schedule.remaining = [p.get("name", "") for p in queue]
+            print(f"{Fore.YELLOW}Aviso: Prazo esgotado; {len(queue)} programas ficam para a próxima execução.{Style.RESET_ALL}")
+            return
+        
+        # Retirado da fila para que o programa processado não fique preso na memória
+        program = queue.popleft()
+        schedule.started.add(program.get("name", ""))
+        yield program
+
+def pending_file_path(shard=None):
+    """Arquivo com os programas que ficaram para a próxima execução"""
+    if shard:
+        return os.path.join(OUTPUT_DIR, f"pending-shard-{shard[0]}-of-{shard[1]}.json")
+    return os.path.join(OUTPUT_DIR, "pending.json")
+
+def load_pending(path):
+    """Lê a lista de programas pendentes da execução anterior"""
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get("programs", [])
+    except Exception as e:
+        print(f"{Fore.YELLOW}Aviso: Erro ao ler programas pendentes: {e}{Style.RESET_ALL}")
         return []
 
-    print(f"{Fore.CYAN}Filtrando programas da HackerOne...{Style.RESET_ALL}")
+def save_pending(path, schedule, data):
+    """Atualiza os pendentes: os que sobraram agora e os antigos que esta execução não alcançou"""
+    remaining = schedule.deferred()
+    remaining_set = set(remaining)
+    # Só saem os programas que deixaram o índice; os excluídos pelos filtros desta execução continuam pendentes
+    index_names = {p.get("name", "") for p in data}
+    remaining += [name for name in schedule.pending
+                  if name in index_names and name not in schedule.started and name not in remaining_set]
     
-    # Filtrando programas da HackerOne
-    hackerone_programs = []
+    if not remaining:
+        if os.path.exists(path):
+            os.remove(path)
+        return
     
+    create_output_dir()
+    with atomic_write(path) as f:
+        json.dump({"saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "programs": remaining}, f, ensure_ascii=False)
+    print(f"{Fore.YELLOW}{len(remaining)} programas pendentes registrados em: {path}{Style.RESET_ALL}")
+
+def annotate_programs(programs):
+    """Adiciona informações de pagamento, datas e novos subdomínios"""
     # Contador para gerar datas únicas
     date_counter = 0
     
-    for program in data:
-        # Verifica se é um programa da HackerOne
-        if program.get("program_url", "").startswith("https://hackerone.com/"):
-            # Se um nome de programa foi especificado, verifica se corresponde
-            if program_name and program_name.lower() not in program.get("name", "").lower():
-                continue
-            
-            # Se only_rewards for True, verifica se o programa paga recompensas
-            if not only_rewards or program.get("bounty", False):
-                # Adiciona informações sobre o status de pagamento
-                program["payment_status"] = "Paga recompensas" if program.get("bounty", False) else "Não paga recompensas"
-                
-                # Extrai informações de recompensa
-                reward_info = extract_reward_info(program)
-                program["payment_details"] = reward_info
-                
-                # Extrai informações de datas
-                date_info = extract_dates_from_program(program)
-                program["date_info"] = date_info
-                
-                # Verifica se há novos subdomínios
-                program["has_new_subdomains"] = check_new_subdomains(program)
-                
-                # Extrai domínios e compara com versão anterior
-                if program.get("URL"):
-                    current_domains, new_domains, removed_domains = download_and_compare_domains(program["URL"], program["name"])
-                    program["extracted_domains"] = current_domains
-                    program["new_domains"] = new_domains
-                    program["removed_domains"] = removed_domains
-                    if new_domains or removed_domains:
-                        program["last_scope_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                else:
-                    program["extracted_domains"] = extract_domains(program)
-                    program["new_domains"] = []
-                    program["removed_domains"] = []
-                
-                # Corrige o problema de datas iguais
-                if not program.get("last_updated") or program.get("last_updated") == "1970-01-01":
-                    base_date = datetime.now() - timedelta(days=date_counter)
-                    random_seconds = random.randint(0, 59)
-                    base_date = base_date.replace(second=random_seconds)
-                    program["last_updated"] = base_date.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-                    date_counter += 1
-                
-                hackerone_programs.append(program)
+    for program in programs:
+        # Adiciona informações sobre o status de pagamento
+        program["payment_status"] = "Paga recompensas" if program.get("bounty", False) else "Não paga recompensas"
+        
+        # Extrai informações de recompensa
+        program["payment_details"] = extract_reward_info(program)
+        
+        # Extrai informações de datas
+        program["date_info"] = extract_dates_from_program(program)
+        
+        # Verifica se há novos subdomínios
+        program["has_new_subdomains"] = check_new_subdomains(program)
+        
+        # Corrige o problema de datas iguais
+        if not program.get("last_updated") or program.get("last_updated") == "1970-01-01":
+            base_date = datetime.now() - timedelta(days=date_counter)
+            random_seconds = random.randint(0, 59)
+            base_date = base_date.replace(second=random_seconds)
+            program["last_updated"] = base_date.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            date_counter += 1
+        
+        yield program
+
+def fetch_program_scopes(programs):
+    """Baixa o arquivo de domínios de cada programa, produzindo (programa, domínios atuais ou None)"""
+    for program in programs:
+        current_domains = None
+        if program.get("URL"):
+            print(f"{Fore.CYAN}Baixando arquivo de domínios para {program['name']}...{Style.RESET_ALL}")
+            try:
+                current_domains = fetch_program_domains(program["URL"])
+            except Exception as e:
+                print(f"{Fore.RED}Erro ao baixar/processar domínios: {e}{Style.RESET_ALL}")
+        yield program, current_domains
+
+class ChangeEmitter:
+    """Emite as mudanças de escopo em NDJSON assim que cada programa é comparado"""
+    def __init__(self, stream):
+        self.stream = stream
+        self.enabled = True
+        # No modo com processos, as mudanças chegam por callbacks de threads diferentes
+        self.lock = threading.Lock()
+
+    def emit(self, program, new_domains, removed_domains):
+        if not (new_domains or removed_domains):
+            return
+        
+        timestamp = datetime.now(pytz.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        base = {"program": program.get("name", ""), "program_url": program.get("program_url", ""), "timestamp": timestamp}
+        with self.lock:
+            if not self.enabled:
+                return
+            try:
+                for action, domains in (("added", new_domains), ("removed", removed_domains)):
+                    for domain in domains:
+                        line = {**base, "action": action, "domain": domain}
+                        self.stream.write(json.dumps(line, ensure_ascii=False) + "\n")
+                # Um flush por programa: o consumidor recebe as mudanças sem esperar o fim da execução
+                self.stream.flush()
+            except BrokenPipeError:
+                print(f"{Fore.YELLOW}Aviso: Consumidor das mudanças foi encerrado; emissão desativada.{Style.RESET_ALL}")
+                self.enabled = False
+
+def open_change_emitter(target):
+    """Abre o destino das mudanças: '-' para a saída padrão, ou um arquivo/FIFO"""
+    if target == "-":
+        stream = sys.stdout
+        # As mensagens de progresso passam para stderr para não misturar com o NDJSON
+        sys.stdout = sys.stderr
+    else:
+        # Abrir um FIFO bloqueia até que um leitor esteja conectado
+        stream = open(target, "a", encoding="utf-8")
+    return ChangeEmitter(stream)
+
+def set_program_scope(program, current, new_domains, removed_domains):
+    """Registra no programa os domínios atuais e as mudanças encontradas"""
+    program["extracted_domains"] = current
+    program["new_domains"] = new_domains
+    program["removed_domains"] = removed_domains
+    if new_domains or removed_domains:
+        program["last_scope_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def diff_program_scopes(scopes, emitter=None):
+    """Compara os domínios de cada programa com o cache anterior"""
+    for program, current_domains in scopes:
+        if not program.get("URL"):
+            # Programa sem arquivo de domínios: usa os dados do próprio índice
+            set_program_scope(program, extract_domains(program), [], [])
+        elif current_domains is None:
+            # Download falhou: não altera o cache
+            set_program_scope(program, [], [], [])
+        else:
+            current, new_domains, removed_domains = compare_with_cache(program["name"], current_domains)
+            set_program_scope(program, current, new_domains, removed_domains)
+            if emitter:
+                emitter.emit(program, new_domains, removed_domains)
+        yield program
+
+def write_scope_fragment(current, new_domains, removed_domains):
+    """Grava o escopo já no formato JSON dos campos do programa, para ser copiado sem decodificar"""
+    fd, path = tempfile.mkstemp(prefix="whichone-scope-", suffix=".json")
+    scope = {"extracted_domains": current, "new_domains": new_domains, "removed_domains": removed_domains}
+    if new_domains or removed_domains:
+        scope["last_scope_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with os.fdopen(fd, "wb") as f:
+        # Sem as chaves externas: o conteúdo é inserido no fim do JSON do programa
+        f.write(b", " + json.dumps(scope, ensure_ascii=False)[1:-1].encode("utf-8"))
+    return path
+
+def write_changes_fragment(new_domains, removed_domains):
+    """Grava as mudanças do programa para o emissor do processo principal"""
+    fd, path = tempfile.mkstemp(prefix="whichone-changes-", suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"new": new_domains, "removed": removed_domains}, f, ensure_ascii=False)
+    return path
+
+def scope_worker(url, program_name, with_changes=False):
+    """Baixa, extrai e compara os domínios de um programa em um processo separado"""
+    # As mensagens são capturadas e exibidas pelo processo principal, na ordem dos programas
+    log = io.StringIO()
+    result = {"ok": False, "scope_path": None, "changes_path": None, "total": 0, "new": 0, "removed": 0}
     
-    # Ordena os programas por data de atualização (mais recente primeiro)
-    hackerone_programs.sort(key=lambda x: x.get("last_updated", "1970-01-01"), reverse=True)
+    with contextlib.redirect_stdout(log):
+        print(f"{Fore.CYAN}Baixando arquivo de domínios para {program_name}...{Style.RESET_ALL}")
+        try:
+            current_domains = fetch_program_domains(url)
+            if current_domains is not None:
+                current, new_domains, removed_domains = compare_with_cache(program_name, current_domains)
+                # Os domínios vão para o disco; entre processos trafegam apenas caminhos e contagens
+                result.update(ok=True, scope_path=write_scope_fragment(current, new_domains, removed_domains),
+                              total=len(current), new=len(new_domains), removed=len(removed_domains))
+                if with_changes and (new_domains or removed_domains):
+                    result["changes_path"] = write_changes_fragment(new_domains, removed_domains)
+        except Exception as e:
+            print(f"{Fore.RED}Erro ao baixar/processar domínios: {e}{Style.RESET_ALL}")
     
-    # Se top_count for especificado, limita o número de programas
-    if top_count is not None:
-        hackerone_programs = hackerone_programs[:top_count]
+    result["log"] = log.getvalue()
+    return result
+
+def remove_fragment(path):
+    """Remove um fragmento temporário gravado por scope_worker"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def emit_scope_result(emitter, program, future):
+    """Callback que emite as mudanças assim que o processo do programa termina"""
+    if future.cancelled() or future.exception():
+        return
+    path = future.result()["changes_path"]
+    if not path:
+        return
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            changes = json.load(f)
+        emitter.emit(program, changes["new"], changes["removed"])
+    finally:
+        remove_fragment(path)
+
+def write_program_json(program, out):
+    """Grava o JSON do programa (em bytes); o escopo de scope_worker é copiado do fragmento"""
+    scope_path = program.get("_scope_path")
+    if not scope_path:
+        out.write(json.dumps(program, ensure_ascii=False).encode("utf-8"))
+        return
     
-    # Contagem de programas
-    total_programs = len([p for p in data if p.get("program_url", "").startswith("https://hackerone.com/")])
-    reward_programs = len([p for p in hackerone_programs if p.get("bounty", False)])
+    fields = {key: value for key, value in program.items() if key != "_scope_path"}
+    out.write(json.dumps(fields, ensure_ascii=False)[:-1].encode("utf-8"))
+    with open(scope_path, 'rb') as f:
+        shutil.copyfileobj(f, out)
+    out.write(b"}")
+    remove_fragment(scope_path)
+
+def load_program_scope(program):
+    """Carrega no programa o escopo gravado por scope_worker (para os modos que o exibem da memória)"""
+    scope_path = program.pop("_scope_path", None)
+    if scope_path:
+        with open(scope_path, 'r', encoding='utf-8') as f:
+            program.update(json.loads("{" + f.read()[2:] + "}"))
+        remove_fragment(scope_path)
+    return program
+
+def finish_program_scope(program, future):
+    """Aplica ao programa o resultado do processo (ou extrai do índice se não há arquivo)"""
+    if future is None:
+        set_program_scope(program, extract_domains(program), [], [])
+        return program
+    
+    try:
+        result = future.result()
+    except Exception as e:
+        print(f"{Fore.RED}Erro ao baixar/processar domínios: {e}{Style.RESET_ALL}")
+        set_program_scope(program, [], [], [])
+        return program
+    
+    print(result["log"], end="")
+    if result["ok"]:
+        # O escopo fica no fragmento até o programa ser gravado (write_program_json)
+        program["_scope_path"] = result["scope_path"]
+    else:
+        set_program_scope(program, [], [], [])
+    return program
+
+def process_program_scopes_parallel(programs, cpu_workers, emitter=None, schedule=None):
+    """Distribui download, extração e comparação entre processos, mantendo a ordem dos programas"""
+    pending = deque()
+    
+    def finish(program, future):
+        # Com o prazo esgotado, cancela os programas que ainda não começaram
+        if future is not None and schedule and schedule.expired() and future.cancel():
+            schedule.cancelled.append(program.get("name", ""))
+            return None
+        return finish_program_scope(program, future)
+    
+    with ProcessPoolExecutor(max_workers=cpu_workers) as executor:
+        for program in programs:
+            future = None
+            if program.get("URL"):
+                future = executor.submit(scope_worker, program["URL"], program["name"], emitter is not None)
+                if emitter:
+                    future.add_done_callback(partial(emit_scope_result, emitter, program))
+            pending.append((program, future))
+            
+            # Limita os programas em andamento para manter a memória estável
+            while len(pending) > cpu_workers * 2:
+                finished = finish(*pending.popleft())
+                if finished:
+                    yield finished
+        
+        while pending:
+            finished = finish(*pending.popleft())
+            if finished:
+                yield finished
+
+def stream_hackerone_programs(data, only_rewards=True, program_name=None, emitter=None, cpu_workers=1, schedule=None):
+    """Encadeia as etapas do pipeline, processando um programa por vez"""
+    programs = ingest_programs(data, only_rewards, program_name)
+    if schedule:
+        programs = schedule_programs(programs, schedule)
+    programs = annotate_programs(programs)
+    if cpu_workers > 1:
+        return process_program_scopes_parallel(programs, cpu_workers, emitter, schedule)
+    scopes = fetch_program_scopes(programs)
+    return diff_program_scopes(scopes, emitter)
+
+def print_filter_summary(data, only_rewards, filtered_count, reward_programs):
+    """Exibe a contagem de programas após a filtragem"""
+    total_programs = len([p for p in data if is_hackerone_program(p)])
     
     print(f"{Fore.CYAN}Detalhes da filtragem:{Style.RESET_ALL}")
     print(f"- Total de programas na fonte: {len(data)}")
     print(f"- Programas da HackerOne: {total_programs}")
     print(f"- Programas com recompensas: {reward_programs}")
-    print(f"- Programas filtrados: {len(hackerone_programs)}")
+    print(f"- Programas filtrados: {filtered_count}")
     
     if only_rewards:
         print(f"{Fore.GREEN}Encontrados {reward_programs} de {total_programs} programas da HackerOne que pagam recompensas.{Style.RESET_ALL}")
     else:
-        print(f"{Fore.GREEN}Encontrados {len(hackerone_programs)} de {total_programs} programas da HackerOne.{Style.RESET_ALL}")
+        print(f"{Fore.GREEN}Encontrados {filtered_count} de {total_programs} programas da HackerOne.{Style.RESET_ALL}")
         print(f"{Fore.GREEN}Desses, {reward_programs} pagam recompensas.{Style.RESET_ALL}")
+
+def filter_hackerone_rewards(data, only_rewards=True, top_count=None, program_name=None, emitter=None, cpu_workers=1):
+    if not data:
+        print(f"{Fore.RED}Nenhum dado de programas encontrado.{Style.RESET_ALL}")
+        return []
+
+    print(f"{Fore.CYAN}Filtrando programas da HackerOne...{Style.RESET_ALL}")
+    
+    # Filtrando programas da HackerOne
+    hackerone_programs = [load_program_scope(p) for p in stream_hackerone_programs(data, only_rewards, program_name, emitter, cpu_workers)]
+    
+    # Ordena os programas por data de atualização (mais recente primeiro)
+    hackerone_programs.sort(key=lambda x: x.get("last_updated", "1970-01-01"), reverse=True)
+    
+    # Se top_count for especificado, limita o número de programas
+    if top_count is not None:
+        hackerone_programs = hackerone_programs[:top_count]
+    
+    reward_programs = len([p for p in hackerone_programs if p.get("bounty", False)])
+    print_filter_summary(data, only_rewards, len(hackerone_programs), reward_programs)
     
     return hackerone_programs
 
@@ -613,75 +1183,431 @@ def format_program_info(program):
 {domains_info}"""
     return formatted_info
 
+def program_sort_date(program, use_launch_date=True):
+    """Retorna a data usada para ordenar o programa"""
+    try:
+        if use_launch_date and program.get("date_info", {}).get("launch_date"):
+            date_str = program["date_info"]["launch_date"]
+            try:
+                return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S.%fZ")
+            except ValueError:
+                try:
+                    return datetime.strptime(date_str, "%Y-%m-%d")
+                except ValueError:
+                    pass
+        return datetime.strptime(program.get("last_updated", "1970-01-01"), "%Y-%m-%dT%H:%M:%S.%fZ")
+    except (ValueError, TypeError):
+        return datetime.strptime("1970-01-01", "%Y-%m-%d")
+
 def sort_by_date(hackerone_programs, use_launch_date=True):
     """Ordena programas por data de lançamento ou data de adição"""
-    def get_date(program):
+    return sorted(hackerone_programs, key=lambda p: program_sort_date(p, use_launch_date), reverse=True)
+
+def program_year(program):
+    """Retorna o ano em que o programa será agrupado"""
+    # Usando a data de lançamento se disponível, senão a data de adição
+    launch_date = program.get("date_info", {}).get("launch_date", program.get("last_updated", datetime.now().strftime("%Y-%m-%d")))
+    
+    try:
+        # Tenta primeiro o formato ISO 8601
+        dt = datetime.strptime(launch_date, "%Y-%m-%dT%H:%M:%S.%fZ")
+    except ValueError:
         try:
-            if use_launch_date and program.get("date_info", {}).get("launch_date"):
-                date_str = program["date_info"]["launch_date"]
-                try:
-                    return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S.%fZ")
-                except ValueError:
-                    try:
-                        return datetime.strptime(date_str, "%Y-%m-%d")
-                    except ValueError:
-                        pass
-            return datetime.strptime(program.get("last_updated", "1970-01-01"), "%Y-%m-%dT%H:%M:%S.%fZ")
-        except (ValueError, TypeError):
-            return datetime.strptime("1970-01-01", "%Y-%m-%d")
+            # Tenta o formato simples de data
+            dt = datetime.strptime(launch_date, "%Y-%m-%d")
+        except ValueError:
+            # Se falhar, usa a data atual
+            dt = datetime.now()
     
-    return sorted(hackerone_programs, key=get_date, reverse=True)
+    return dt.year
 
 def create_output_dir():
     if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
         print(f"{Fore.GREEN}Diretório {OUTPUT_DIR} criado com sucesso!{Style.RESET_ALL}")
 
-def save_programs_by_year(programs):
+def spool_programs(programs, spool, use_launch_date=True):
+    """Grava cada programa em um arquivo temporário, mantendo em memória apenas as chaves de ordenação"""
+    entries = []
+    for program in programs:
+        offset = spool.tell()
+        write_program_json(program, spool)
+        entries.append({
+            "offset": offset,
+            "length": spool.tell() - offset,
+            "bounty": program.get("bounty", False),
+            "last_updated": program.get("last_updated", "1970-01-01"),
+            "sort_date": program_sort_date(program, use_launch_date),
+            "year": program_year(program),
+            "year_key": program.get("date_info", {}).get("launch_date", program.get("last_updated", "1970-01-01"))
+        })
+        spool.write(b"\n")
+    return entries
+
+def sort_spooled_entries(entries):
+    """Ordena as entradas como o modo em lista: data de atualização e depois data de lançamento/adição"""
+    entries.sort(key=lambda x: x["last_updated"], reverse=True)
+    entries.sort(key=lambda x: x["sort_date"], reverse=True)
+
+def read_spooled_program(spool, entry):
+    """Lê de volta um programa gravado por spool_programs"""
+    spool.seek(entry["offset"])
+    return json.loads(spool.read(entry["length"]))
+
+def save_programs_by_year(entries, spool):
     create_output_dir()
     
     # Dicionário para armazenar programas por ano
     programs_by_year = {}
     
-    for program in programs:
-        # Usando a data de lançamento se disponível, senão a data de adição
-        launch_date = program.get("date_info", {}).get("launch_date", program.get("last_updated", datetime.now().strftime("%Y-%m-%d")))
-        
-        try:
-            # Tenta primeiro o formato ISO 8601
-            dt = datetime.strptime(launch_date, "%Y-%m-%dT%H:%M:%S.%fZ")
-        except ValueError:
-            try:
-                # Tenta o formato simples de data
-                dt = datetime.strptime(launch_date, "%Y-%m-%d")
-            except ValueError:
-                # Se falhar, usa a data atual
-                dt = datetime.now()
-        
-        year = dt.year
-        
+    for entry in entries:
+        year = entry["year"]
         if year not in programs_by_year:
             programs_by_year[year] = []
-        programs_by_year[year].append(program)
+        programs_by_year[year].append(entry)
     
     # Salva cada ano em um arquivo separado
-    for year, progs in programs_by_year.items():
+    for year, year_entries in programs_by_year.items():
         # Ordena programas por data (mais recente primeiro)
-        progs.sort(key=lambda x: x.get("date_info", {}).get("launch_date", x.get("last_updated", "1970-01-01")), reverse=True)
+        year_entries.sort(key=lambda x: x["year_key"], reverse=True)
         
         # Nome do arquivo
         filename = os.path.join(OUTPUT_DIR, f"bounty_programs_{year}.json")
         
-        # Prepara dados formatados para exibição
         print(f"\n{Fore.CYAN}Programas de {year}:{Style.RESET_ALL}")
-        for prog in progs:
-            print(format_program_info(prog))
-            print()
         
-        # Salva em formato JSON
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(progs, f, indent=4, ensure_ascii=False)
-        print(f"{Fore.GREEN}Salvo {len(progs)} programas no arquivo: {filename}{Style.RESET_ALL}")
+        # Salva em formato JSON, um programa por vez (mesmo formato de json.dump com indent=4)
+        with atomic_write(filename) as f:
+            f.write("[")
+            for i, entry in enumerate(year_entries):
+                prog = read_spooled_program(spool, entry)
+                print(format_program_info(prog))
+                print()
+                f.write(",\n" if i else "\n")
+                f.write(textwrap.indent(json.dumps(prog, indent=4, ensure_ascii=False), "    "))
+            f.write("\n]")
+        print(f"{Fore.GREEN}Salvo {len(year_entries)} programas no arquivo: {filename}{Style.RESET_ALL}")
+
+def iter_json_array(stream):
+    """Lê uma lista JSON de um arquivo em blocos, produzindo um elemento por vez"""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    
+    while True:
+        # Pula o colchete de abertura, as vírgulas e os espaços entre os elementos
+        while position < len(buffer) and buffer[position] in "[, \t\r\n":
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        
+        try:
+            if position == len(buffer):
+                raise json.JSONDecodeError("fim do bloco", buffer, position)
+            item, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # Elemento incompleto: lê mais um bloco (ao menos do tamanho do que já está pendente,
+            # para que elementos grandes não sejam decodificados muitas vezes), descartando o que já foi consumido
+            chunk = stream.read(max(PARSE_CHUNK_SIZE, len(buffer) - position))
+            if not chunk:
+                if buffer[position:].strip():
+                    raise
+                return
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        
+        yield item
+
+def previous_program_records(names):
+    """Registros dos programas informados nos arquivos por ano da execução anterior"""
+    if not names or not os.path.isdir(OUTPUT_DIR):
+        return
+    
+    for file_name in sorted(os.listdir(OUTPUT_DIR)):
+        if not (file_name.startswith("bounty_programs_") and file_name.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(OUTPUT_DIR, file_name), 'r', encoding='utf-8') as f:
+                # Um programa por vez: o arquivo inteiro nunca fica em memória
+                for program in iter_json_array(f):
+                    if isinstance(program, dict) and program.get("name", "") in names:
+                        yield program
+        except Exception as e:
+            print(f"{Fore.YELLOW}Aviso: Erro ao ler {file_name}: {e}{Style.RESET_ALL}")
+
+def stream_programs_by_year(data, only_rewards=True, program_name=None, use_launch_date=True, emitter=None, cpu_workers=1, schedule=None):
+    """Processa os programas um a um e salva por ano, mantendo em memória apenas as chaves de ordenação"""
+    print(f"{Fore.CYAN}Filtrando programas da HackerOne...{Style.RESET_ALL}")
+    
+    with tempfile.TemporaryFile() as spool:
+        programs = stream_hackerone_programs(data, only_rewards, program_name, emitter, cpu_workers, schedule)
+        entries = spool_programs(programs, spool, use_launch_date)
+        
+        reward_programs = len([e for e in entries if e["bounty"]])
+        print_filter_summary(data, only_rewards, len(entries), reward_programs)
+        
+        deferred = schedule.deferred() if schedule else []
+        if deferred:
+            # Programas não alcançados mantêm o registro da execução anterior nos arquivos por ano
+            carried = spool_programs(previous_program_records(set(deferred)), spool, use_launch_date)
+            print(f"{Fore.YELLOW}- Programas adiados: {len(deferred)} ({len(carried)} mantidos da execução anterior){Style.RESET_ALL}")
+            entries += carried
+        
+        if not entries:
+            return 0
+        
+        # Salvando e exibindo os programas organizados por ano
+        sort_spooled_entries(entries)
+        save_programs_by_year(entries, spool)
+    
+    return len(entries)
+
+def parse_shard(value):
+    """Converte 'i/N' (ex: 2/4) em (i, N), com i entre 1 e N"""
+    try:
+        shard, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"shard inválido: {value} (use i/N, ex: 2/4)")
+    if count < 1 or not 1 <= shard <= count:
+        raise argparse.ArgumentTypeError(f"shard inválido: {value} (i deve estar entre 1 e N)")
+    return shard, count
+
+def program_shard(program_name, count):
+    """Shard (1 a N) de um programa, estável entre execuções e máquinas"""
+    digest = hashlib.sha256(program_name.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+def parse_run_id(value):
+    """Valida o identificador da execução distribuída (usado no nome dos fragmentos)"""
+    if not re.fullmatch(r"[A-Za-z0-9._-]{1,64}", value):
+        raise argparse.ArgumentTypeError(f"identificador inválido: {value} (use letras, números, '.', '_' ou '-')")
+    return value
+
+def shard_fragment_path(run_id, shard, count):
+    """Caminho do fragmento gravado pelo shard"""
+    return os.path.join(SHARD_DIR, f"shard-{run_id}-{shard}-of-{count}.ndjson")
+
+def cached_fragments_path():
+    """Registro dos fragmentos cujas mudanças já estão no cache local"""
+    return os.path.join(OUTPUT_DIR, "cache", "shard_fragments.log")
+
+def load_cached_fragments():
+    """Identificadores dos fragmentos já refletidos no cache local"""
+    path = cached_fragments_path()
+    if not os.path.exists(path):
+        return set()
+    with open(path, 'r', encoding='utf-8') as f:
+        return set(line.rstrip("\n") for line in f if line.strip())
+
+def fragment_registry_key(fragment_id, program_name=None):
+    """Chave do registro: o fragmento inteiro ou um programa restaurado a partir dele"""
+    return f"{fragment_id} {program_name}" if program_name else fragment_id
+
+def mark_fragment_cached(fragment_id, program_name=None):
+    """Registra que o cache local já contém o escopo e o log de mudanças do fragmento (ou de um de seus programas)"""
+    path = cached_fragments_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with file_lock(f"{path}.lock"):
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(f"{fragment_registry_key(fragment_id, program_name)}\n")
+
+def existing_fragment_ids():
+    """Identificadores dos fragmentos ainda presentes em SHARD_DIR"""
+    if not os.path.isdir(SHARD_DIR):
+        return set()
+    return {header.get("fragment_id") for header in load_fragment_headers().values()}
+
+def trim_cached_fragments():
+    """Remove do registro os fragmentos que já não existem em SHARD_DIR; retorna quantos saíram"""
+    path = cached_fragments_path()
+    if not os.path.exists(path):
+        return 0
+    
+    with file_lock(f"{path}.lock"):
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = [line for line in f if line.strip()]
+        existing = existing_fragment_ids()
+        kept = [line for line in lines if line.split()[0] in existing]
+        if len(kept) != len(lines):
+            with atomic_write(path) as f:
+                f.writelines(kept)
+    return len(lines) - len(kept)
+
+def stream_programs_to_shard(data, shard, count, only_rewards=True, program_name=None, emitter=None, cpu_workers=1, schedule=None, run_id=None):
+    """Processa apenas os programas do shard e grava o resultado em um fragmento para o merge"""
+    # Posição no índice completo: o merge reproduz a mesma ordem de uma execução única
+    positions = {p.get("name", ""): i for i, p in enumerate(data)}
+    shard_data = [p for p in data if program_shard(p.get("name", ""), count) == shard]
+    
+    print(f"{Fore.CYAN}Shard {shard}/{count}: {len(shard_data)} de {len(data)} programas.{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Filtrando programas da HackerOne...{Style.RESET_ALL}")
+    
+    # Sem --run-id, os shards de uma mesma execução se reconhecem pelo índice processado
+    index_sha256 = hashlib.sha256(encode_snapshot(data)).hexdigest()
+    run_id = run_id or index_sha256[:16]
+    
+    os.makedirs(SHARD_DIR, exist_ok=True)
+    fragment_file = shard_fragment_path(run_id, shard, count)
+    header = {
+        "shard": shard,
+        "shard_count": count,
+        "run_id": run_id,
+        "fragment_id": uuid.uuid4().hex,
+        "host": socket.gethostname(),
+        "index_sha256": index_sha256,
+        "started_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+    
+    total = 0
+    reward_programs = 0
+    with atomic_write(fragment_file, "wb") as f:
+        f.write(json.dumps(header).encode("utf-8") + b"\n")
+        for program in stream_hackerone_programs(shard_data, only_rewards, program_name, emitter, cpu_workers, schedule):
+            # Mesmo formato de json.dumps({"position": ..., "program": ...})
+            f.write(b'{"position": %d, "program": ' % positions.get(program.get("name", ""), len(data)))
+            write_program_json(program, f)
+            f.write(b"}\n")
+            total += 1
+            if program.get("bounty", False):
+                reward_programs += 1
+        
+        # Programas adiados pelo prazo: o merge mantém o registro da execução anterior
+        deferred = schedule.deferred() if schedule else []
+        if deferred:
+            record = {"deferred": {name: positions.get(name, len(data)) for name in deferred}}
+            f.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+    
+    # O cache deste diretório já tem as mudanças do fragmento: o merge não deve repeti-las
+    mark_fragment_cached(header["fragment_id"])
+    
+    print_filter_summary(shard_data, only_rewards, total, reward_programs)
+    if schedule and schedule.deferred():
+        print(f"{Fore.YELLOW}- Programas adiados: {len(schedule.deferred())}{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}Fragmento do shard salvo em: {fragment_file}{Style.RESET_ALL}")
+    return total
+
+def restore_program_cache(program, timestamp, fragment_id):
+    """Grava no cache local o escopo e o log de mudanças de um programa processado com outro cache"""
+    if not program.get("URL") or not program.get("extracted_domains"):
+        return
+    
+    cache_dir = os.path.join(OUTPUT_DIR, "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    name = program["name"]
+    with file_lock(program_lock_path(name)):
+        write_domains_cache(cache_dir, name, program["extracted_domains"])
+        append_change_log(cache_dir, name, program.get("last_scope_update") or timestamp,
+                          program.get("new_domains", []), program.get("removed_domains", []),
+                          len(program["extracted_domains"]))
+        # Registrado por programa: um merge interrompido não repete as entradas já gravadas
+        mark_fragment_cached(fragment_id, name)
+
+def load_fragment_headers():
+    """Lê o cabeçalho de cada fragmento em SHARD_DIR"""
+    headers = {}
+    for file_name in sorted(os.listdir(SHARD_DIR)):
+        if not (file_name.startswith("shard-") and file_name.endswith(".ndjson")):
+            continue
+        path = os.path.join(SHARD_DIR, file_name)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                headers[path] = json.loads(f.readline())
+        except Exception as e:
+            print(f"{Fore.YELLOW}Aviso: Erro ao ler o fragmento {file_name}: {e}{Style.RESET_ALL}")
+    return headers
+
+def group_fragment_runs(headers):
+    """Agrupa os fragmentos por execução (identificador e número de shards)"""
+    runs = {}
+    for path, header in headers.items():
+        key = (header.get("run_id") or header["index_sha256"][:16], header["shard_count"])
+        run = runs.setdefault(key, {"run_id": key[0], "count": key[1], "shards": {}, "started_at": ""})
+        run["shards"][header["shard"]] = (path, header)
+        run["started_at"] = max(run["started_at"], header["started_at"])
+    return sorted(runs.values(), key=lambda run: run["started_at"])
+
+def merge_shard_fragments(use_launch_date=True):
+    """Combina os fragmentos dos shards nos mesmos arquivos por ano de uma execução única"""
+    headers = load_fragment_headers() if os.path.isdir(SHARD_DIR) else {}
+    if not headers:
+        print(f"{Fore.RED}Erro: Nenhum fragmento encontrado em {SHARD_DIR}.{Style.RESET_ALL}")
+        return 0
+    
+    # Usa o conjunto completo mais recente; shards de execuções diferentes nunca são misturados
+    runs = group_fragment_runs(headers)
+    complete = [run for run in runs if len(run["shards"]) == run["count"]]
+    if not complete:
+        print(f"{Fore.RED}Erro: Nenhuma execução com todos os shards:{Style.RESET_ALL}")
+        for run in runs:
+            missing = sorted(set(range(1, run["count"] + 1)) - set(run["shards"]))
+            print(f"- {run['run_id']} ({run['count']} shards, {run['started_at']}): faltam {', '.join(str(m) for m in missing)}")
+        print(f"{Fore.YELLOW}Dica: use o mesmo --run-id em todos os shards quando eles buscarem o índice em momentos diferentes.{Style.RESET_ALL}")
+        return 0
+    
+    selected = complete[-1]
+    for run in runs[runs.index(selected) + 1:]:
+        print(f"{Fore.YELLOW}Aviso: Execução {run['run_id']} ({len(run['shards'])} de {run['count']} shards) está incompleta e foi ignorada.{Style.RESET_ALL}")
+    if len({header["index_sha256"] for _, header in selected["shards"].values()}) > 1:
+        print(f"{Fore.YELLOW}Aviso: Os shards foram processados a partir de índices diferentes.{Style.RESET_ALL}")
+    
+    print(f"{Fore.CYAN}Combinando {selected['count']} fragmentos da execução {selected['run_id']}...{Style.RESET_ALL}")
+    
+    cached_fragments = load_cached_fragments()
+    positions = []
+    deferred = {}
+    
+    def fragment_programs():
+        for shard in sorted(selected["shards"]):
+            path, header = selected["shards"][shard]
+            # Fragmentos gravados com outro diretório de cache trazem o escopo e o log de mudanças
+            fragment_id = header.get("fragment_id")
+            restore = fragment_id and fragment_id not in cached_fragments
+            with open(path, 'r', encoding='utf-8') as f:
+                f.readline()
+                for line in f:
+                    record = json.loads(line)
+                    if "deferred" in record:
+                        deferred.update(record["deferred"])
+                        continue
+                    name = record["program"].get("name", "")
+                    if restore and fragment_registry_key(fragment_id, name) not in cached_fragments:
+                        restore_program_cache(record["program"], header["started_at"], fragment_id)
+                    positions.append(record["position"])
+                    yield record["program"]
+            if restore:
+                mark_fragment_cached(fragment_id)
+    
+    def carried_programs():
+        # Como na execução única: os adiados mantêm o registro dos arquivos por ano atuais
+        for program in previous_program_records(set(deferred)):
+            positions.append(deferred[program["name"]])
+            yield program
+    
+    with tempfile.TemporaryFile() as spool:
+        entries = spool_programs(fragment_programs(), spool, use_launch_date)
+        if deferred:
+            carried = spool_programs(carried_programs(), spool, use_launch_date)
+            print(f"{Fore.YELLOW}- Programas adiados: {len(deferred)} ({len(carried)} mantidos da execução anterior){Style.RESET_ALL}")
+            entries += carried
+        if not entries:
+            return 0
+        
+        # Restaura a ordem do índice completo antes das ordenações por data
+        for entry, position in zip(entries, positions):
+            entry["position"] = position
+        entries.sort(key=lambda x: x["position"])
+        
+        sort_spooled_entries(entries)
+        save_programs_by_year(entries, spool)
+    
+    # Fragmentos combinados e os de execuções anteriores não são mais necessários
+    for run in runs[:runs.index(selected) + 1]:
+        for path, _ in run["shards"].values():
+            os.remove(path)
+    print(f"{Fore.GREEN}Fragmentos combinados removidos de {SHARD_DIR}.{Style.RESET_ALL}")
+    
+    return len(entries)
 
 def display_top_programs(programs, count=10, only_rewards=True):
     """Exibe os programas mais recentes"""
@@ -804,13 +1730,482 @@ def display_program_scope(program_name, data):
     except Exception as e:
         print(f"{Fore.YELLOW}⚠️ Aviso: Erro ao salvar arquivos de escopo: {e}{Style.RESET_ALL}")
 
+def parse_size(value):
+    """Converte tamanhos como 500M, 2G ou 1048576 em bytes"""
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+    text = str(value).strip().upper().rstrip("B")
+    try:
+        if text and text[-1] in units:
+            size = int(float(text[:-1]) * units[text[-1]])
+        else:
+            size = int(text)
+    except (ValueError, OverflowError):
+        raise argparse.ArgumentTypeError(f"tamanho inválido: {value}")
+    if size < 0:
+        raise argparse.ArgumentTypeError(f"o tamanho não pode ser negativo: {value}")
+    return size
+
+def format_size(size):
+    """Formata um tamanho em bytes para exibição"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+def scan_cache_entries():
+    """Agrupa os arquivos do cache por programa, com tamanho e último acesso"""
+    cache_dir = os.path.join(OUTPUT_DIR, "cache")
+    entries = {}
+    if not os.path.isdir(cache_dir):
+        return []
+    
+    for file_name in os.listdir(cache_dir):
+        for suffix, kind in (("_domains.txt", "domains"), ("_changes.log", "log")):
+            if not file_name.endswith(suffix):
+                continue
+            path = os.path.join(cache_dir, file_name)
+            stat = os.stat(path)
+            name = file_name[:-len(suffix)]
+            entry = entries.setdefault(name, {"name": name, "files": [], "domains_size": 0, "log_size": 0, "last_access": 0})
+            entry["files"].append(path)
+            entry[f"{kind}_size"] += stat.st_size
+            # O cache é regravado a cada comparação: a data de modificação indica o último uso
+            entry["last_access"] = max(entry["last_access"], stat.st_mtime)
+    
+    return list(entries.values())
+
+def load_index_names():
+    """Nomes dos programas do snapshot mais recente (None se não houver snapshot)"""
+    entry = find_snapshot("9999")
+    if not entry:
+        return None
+    return {p.get("name", "") for p in load_snapshot(entry["sha256"])}
+
+def plan_cache_eviction(entries, index_names, max_size, max_age_days):
+    """Decide quais programas devem sair do cache: órfãos, expirados e, por fim, os menos usados"""
+    now = datetime.now().timestamp()
+    evicted = []
+    kept = []
+    
+    for entry in entries:
+        if index_names is not None and entry["name"] not in index_names:
+            evicted.append((entry, "órfão"))
+        elif max_age_days and now - entry["last_access"] > max_age_days * 86400:
+            evicted.append((entry, "expirado"))
+        else:
+            kept.append(entry)
+    
+    # Remove os menos usados recentemente até caber no orçamento de tamanho
+    kept.sort(key=lambda e: e["last_access"])
+    total = sum(e["domains_size"] + e["log_size"] for e in kept)
+    while max_size and kept and total > max_size:
+        entry = kept.pop(0)
+        total -= entry["domains_size"] + entry["log_size"]
+        evicted.append((entry, "LRU"))
+    
+    return evicted, kept
+
+def compact_change_log(log_file, keep=CACHE_LOG_KEEP):
+    """Mantém apenas as últimas entradas com mudanças (e a entrada mais recente) do log"""
+    with open(log_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    blocks = content.split("\n=== Mudanças em ")[1:]
+    if not blocks:
+        return 0
+    
+    with_changes = [i for i, block in enumerate(blocks) if "\n+ " in block or "\n- " in block]
+    keep_indexes = set(with_changes[-keep:]) | {len(blocks) - 1}
+    compacted = "".join(f"\n=== Mudanças em {blocks[i]}" for i in sorted(keep_indexes))
+    
+    if len(compacted) == len(content):
+        return 0
+    
+    stat = os.stat(log_file)
+    with atomic_write(log_file) as f:
+        f.write(compacted)
+    # Preserva a data de modificação, usada como último acesso do programa
+    os.utime(log_file, (stat.st_atime, stat.st_mtime))
+    return len(content.encode('utf-8')) - len(compacted.encode('utf-8'))
+
+def scan_lock_files():
+    """Programas com arquivo de lock em cache/locks"""
+    lock_dir = os.path.join(OUTPUT_DIR, "cache", "locks")
+    if not os.path.isdir(lock_dir):
+        return []
+    return [file_name[:-len(".lock")] for file_name in os.listdir(lock_dir) if file_name.endswith(".lock")]
+
+def count_cached_fragments():
+    """Fragmentos no registro do cache: (total, quantos já não existem em SHARD_DIR)"""
+    path = cached_fragments_path()
+    if not os.path.exists(path):
+        return 0, 0
+    with open(path, 'r', encoding='utf-8') as f:
+        ids = {line.split()[0] for line in f if line.strip()}
+    existing = existing_fragment_ids()
+    return len(ids), len([i for i in ids if i not in existing])
+
+def show_cache_stats(max_size=CACHE_MAX_SIZE, max_age_days=CACHE_MAX_AGE_DAYS):
+    """Exibe o uso do cache e o que seria removido por --cache-gc"""
+    entries = scan_cache_entries()
+    lock_names = scan_lock_files()
+    fragments, stale_fragments = count_cached_fragments()
+    if not (entries or lock_names or fragments):
+        print(f"{Fore.YELLOW}Cache vazio.{Style.RESET_ALL}")
+        return
+    
+    index_names = load_index_names()
+    evicted, _ = plan_cache_eviction(entries, index_names, max_size, max_age_days)
+    domains_size = sum(e["domains_size"] for e in entries)
+    log_size = sum(e["log_size"] for e in entries)
+    
+    print(f"{Fore.CYAN}📊 Estatísticas do cache ({os.path.join(OUTPUT_DIR, 'cache')}):{Style.RESET_ALL}")
+    print(f"- Programas em cache: {len(entries)}")
+    print(f"- Tamanho total: {format_size(domains_size + log_size)} (orçamento: {format_size(max_size) if max_size else 'ilimitado'})")
+    print(f"- Arquivos de domínios: {format_size(domains_size)}")
+    print(f"- Logs de mudanças: {format_size(log_size)}")
+    if entries:
+        oldest = min(e["last_access"] for e in entries)
+        newest = max(e["last_access"] for e in entries)
+        print(f"- Acesso mais antigo: {datetime.fromtimestamp(oldest).strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"- Acesso mais recente: {datetime.fromtimestamp(newest).strftime('%Y-%m-%d %H:%M:%S')}")
+    orphan_locks = [name for name in lock_names if index_names is not None and name not in index_names]
+    print(f"- Arquivos de lock: {len(lock_names)} ({len(orphan_locks)} de programas órfãos)")
+    print(f"- Fragmentos de shards registrados: {fragments} ({stale_fragments} sem fragmento em {SHARD_DIR})")
+    if index_names is None:
+        print(f"{Fore.YELLOW}Aviso: Nenhum snapshot do índice; programas órfãos não podem ser identificados.{Style.RESET_ALL}")
+    
+    for reason in ("órfão", "expirado", "LRU"):
+        selected = [e for e, r in evicted if r == reason]
+        if selected:
+            size = sum(e["domains_size"] + e["log_size"] for e in selected)
+            print(f"- Seriam removidos ({reason}): {len(selected)} programas, {format_size(size)}")
+
+def run_cache_gc(max_size=CACHE_MAX_SIZE, max_age_days=CACHE_MAX_AGE_DAYS):
+    """Compacta os logs de mudanças e remove do cache programas órfãos, expirados e menos usados"""
+    entries = scan_cache_entries()
+    if not (entries or scan_lock_files() or os.path.exists(cached_fragments_path())):
+        print(f"{Fore.YELLOW}Cache vazio.{Style.RESET_ALL}")
+        return
+    
+    # Compacta primeiro, para que o orçamento de tamanho considere os logs já reduzidos
+    compacted = 0
+    for entry in entries:
+        for path in entry["files"]:
+            if path.endswith("_changes.log"):
+                try:
+                    with file_lock(program_lock_path(entry["name"])):
+                        compacted += compact_change_log(path)
+                except Exception as e:
+                    print(f"{Fore.YELLOW}Aviso: Erro ao compactar {path}: {e}{Style.RESET_ALL}")
+    
+    index_names = load_index_names()
+    if index_names is None:
+        print(f"{Fore.YELLOW}Aviso: Nenhum snapshot do índice; programas órfãos não serão removidos.{Style.RESET_ALL}")
+    
+    evicted, _ = plan_cache_eviction(scan_cache_entries(), index_names, max_size, max_age_days)
+    freed = 0
+    for entry, reason in evicted:
+        with file_lock(program_lock_path(entry["name"])):
+            for path in entry["files"]:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    print(f"{Fore.YELLOW}Aviso: Erro ao remover {path}: {e}{Style.RESET_ALL}")
+        freed += entry["domains_size"] + entry["log_size"]
+        print(f"{Fore.YELLOW}- Removido ({reason}): {entry['name']}{Style.RESET_ALL}")
+    
+    # Locks de programas que saíram do índice; os que estão em uso ficam para a próxima limpeza
+    removed_locks = 0
+    if index_names is not None:
+        lock_dir = os.path.join(OUTPUT_DIR, "cache", "locks")
+        for name in scan_lock_files():
+            if name not in index_names and remove_unused_lock(os.path.join(lock_dir, f"{name}.lock")):
+                removed_locks += 1
+    
+    trimmed = trim_cached_fragments()
+    
+    print(f"{Fore.GREEN}Limpeza concluída: {len(evicted)} programas removidos ({format_size(freed)}), logs compactados em {format_size(compacted)}, "
+          f"{removed_locks} locks órfãos e {trimmed} registros de fragmentos removidos.{Style.RESET_ALL}")
+
+class ResponseCache:
+    """Cache LRU de respostas da API, seguro para várias threads"""
+    def __init__(self, max_entries=SERVE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            # Remove as respostas usadas há mais tempo
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+def program_summary(program):
+    """Resumo leve de um programa para as respostas da API"""
+    return {
+        "name": program.get("name", ""),
+        "program_url": program.get("program_url", ""),
+        "URL": program.get("URL", ""),
+        "bounty": program.get("bounty", False),
+        "last_updated": program.get("last_updated", ""),
+        "count": program.get("count", 0),
+        "change": program.get("change", 0),
+        "is_new": program.get("is_new", False)
+    }
+
+def read_last_changes(log_file):
+    """Lê a entrada mais recente com mudanças de um arquivo _changes.log"""
+    with open(log_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # Cada execução acrescenta uma entrada, mesmo sem mudanças: procura a última que tenha alguma
+    for block in reversed(content.split("=== Mudanças em ")[1:]):
+        lines = block.splitlines()
+        new_domains = [line[2:] for line in lines if line.startswith("+ ")]
+        removed_domains = [line[2:] for line in lines if line.startswith("- ")]
+        if new_domains or removed_domains:
+            timestamp = block.split(" ===", 1)[0]
+            return {"timestamp": timestamp, "new_domains": new_domains, "removed_domains": removed_domains}
+    return None
+
+def build_serve_index(data):
+    """Carrega o índice de programas e os caches de domínios uma única vez"""
+    programs = list(annotate_programs(dict(p) for p in data if is_hackerone_program(p)))
+    by_name = {p.get("name", "").lower(): p for p in programs}
+    
+    scopes = {}
+    changes = {}
+    domain_index = {}
+    cache_dir = os.path.join(OUTPUT_DIR, "cache")
+    
+    for program in programs:
+        name = program.get("name", "")
+        cache_file = os.path.join(cache_dir, f"{name}_domains.txt")
+        if os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    scopes[name] = tuple(line.strip() for line in f if line.strip())
+            except Exception as e:
+                print(f"{Fore.YELLOW}Aviso: Erro ao ler cache de {name}: {e}{Style.RESET_ALL}")
+                continue
+            
+            # Índice reverso domínio -> programas (wildcards indexados pelo domínio base)
+            for domain in scopes[name]:
+                key = domain.lower()
+                if key.startswith("*."):
+                    key = key[2:]
+                domain_index.setdefault(key, set()).add(name)
+        
+        log_file = os.path.join(cache_dir, f"{name}_changes.log")
+        if os.path.exists(log_file):
+            try:
+                last_changes = read_last_changes(log_file)
+                if last_changes:
+                    changes[name] = last_changes
+            except Exception as e:
+                print(f"{Fore.YELLOW}Aviso: Erro ao ler log de mudanças de {name}: {e}{Style.RESET_ALL}")
+    
+    print(f"{Fore.GREEN}Índice carregado: {len(programs)} programas, {len(scopes)} escopos, {len(domain_index)} domínios.{Style.RESET_ALL}")
+    
+    return {
+        "programs": programs,
+        "by_name": by_name,
+        "scopes": scopes,
+        "changes": changes,
+        "domain_index": domain_index,
+        "loaded_at": datetime.now(pytz.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    }
+
+def find_indexed_program(index, name):
+    """Procura um programa pelo nome exato e, se não encontrar, por parte do nome"""
+    name = name.lower()
+    if name in index["by_name"]:
+        return index["by_name"][name]
+    for program in index["programs"]:
+        if name in program.get("name", "").lower():
+            return program
+    return None
+
+def query_int(params, key, default):
+    """Lê um parâmetro inteiro da query string"""
+    try:
+        return max(1, int(params.get(key, [default])[0]))
+    except ValueError:
+        return default
+
+def query_flag(params, key):
+    """Lê um parâmetro booleano da query string"""
+    return params.get(key, ["0"])[0].lower() in ("1", "true", "yes", "sim")
+
+def handle_api_request(index, path, params):
+    """Resolve uma requisição da API, retornando (status HTTP, corpo)"""
+    parts = [unquote(p) for p in path.strip("/").split("/") if p]
+    
+    if not parts:
+        return 200, {
+            "programs": len(index["programs"]),
+            "scopes": len(index["scopes"]),
+            "loaded_at": index["loaded_at"],
+            "endpoints": ["/programs?q=", "/programs/<nome>/scope", "/changes?limit=", "/lookup?host=", "/top?n=&all="]
+        }
+    
+    if parts[0] == "programs" and len(parts) == 1:
+        query = params.get("q", [""])[0].lower()
+        only_rewards = query_flag(params, "bounty")
+        limit = query_int(params, "limit", 50)
+        results = [
+            program_summary(p) for p in index["programs"]
+            if query in p.get("name", "").lower() and (not only_rewards or p.get("bounty", False))
+        ]
+        return 200, {"total": len(results), "results": results[:limit]}
+    
+    if parts[0] == "programs" and len(parts) == 3 and parts[2] == "scope":
+        program = find_indexed_program(index, parts[1])
+        if not program:
+            return 404, {"error": f"Programa '{parts[1]}' não encontrado"}
+        domains = index["scopes"].get(program.get("name", ""))
+        if domains is None:
+            return 404, {"error": f"Escopo de '{program.get('name', '')}' não está em cache"}
+        return 200, {"program": program_summary(program), "total": len(domains), "domains": list(domains)}
+    
+    if parts[0] == "changes" and len(parts) == 1:
+        limit = query_int(params, "limit", 20)
+        recent = sorted(index["changes"].items(), key=lambda item: item[1]["timestamp"], reverse=True)
+        results = [
+            {"name": name, **entry} for name, entry in recent
+            if entry["new_domains"] or entry["removed_domains"]
+        ]
+        return 200, {"total": len(results), "results": results[:limit]}
+    
+    if parts[0] == "lookup" and len(parts) == 1:
+        host = params.get("host", [""])[0].lower().strip(".")
+        if not host:
+            return 400, {"error": "Parâmetro 'host' obrigatório"}
+        # Procura o host e cada domínio pai (a.b.example.com, b.example.com, example.com)
+        labels = host.split(".")
+        matches = []
+        for i in range(len(labels) - 1):
+            candidate = ".".join(labels[i:])
+            for name in sorted(index["domain_index"].get(candidate, ())):
+                matches.append({"program": name, "matched": candidate})
+        return 200, {"host": host, "matches": matches}
+    
+    if parts[0] == "top" and len(parts) == 1:
+        count = query_int(params, "n", 10)
+        programs = index["programs"]
+        if not query_flag(params, "all"):
+            programs = [p for p in programs if p.get("bounty", False)]
+        top_programs = sort_by_date(programs, use_launch_date=True)[:count]
+        return 200, {"results": [program_summary(p) for p in top_programs]}
+    
+    return 404, {"error": "Rota não encontrada"}
+
+def make_api_handler(index, cache):
+    """Cria a classe de handler HTTP ligada ao índice e ao cache de respostas"""
+    class APIHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            cached = cache.get(self.path)
+            if cached is None:
+                parsed = urlparse(self.path)
+                status, body = handle_api_request(index, parsed.path, parse_qs(parsed.query))
+                cached = (status, json.dumps(body, ensure_ascii=False).encode("utf-8"))
+                # Erros de rota não entram no cache
+                if status == 200:
+                    cache.put(self.path, cached)
+            
+            status, payload = cached
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        
+        def log_message(self, format, *args):
+            # Evita uma linha de log por requisição
+            pass
+    
+    return APIHandler
+
+def serve_api(data, host="127.0.0.1", port=8000, cache_size=SERVE_CACHE_SIZE):
+    """Inicia o servidor HTTP local com a API de consulta"""
+    index = build_serve_index(data)
+    cache = ResponseCache(cache_size)
+    server = ThreadingHTTPServer((host, port), make_api_handler(index, cache))
+    
+    print(f"{Fore.CYAN}API disponível em http://{host}:{port}/ (Ctrl+C para encerrar){Style.RESET_ALL}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}Encerrando servidor...{Style.RESET_ALL}")
+    finally:
+        server.server_close()
+        print(f"{Fore.CYAN}Cache de respostas: {cache.hits} acertos, {cache.misses} faltas{Style.RESET_ALL}")
+
 def main():
     args = parse_arguments()
     
+    # Abre o destino das mudanças antes de qualquer mensagem ir para a saída padrão
+    emitter = open_change_emitter(args.emit_changes) if args.emit_changes else None
+    
     print(f"{Fore.CYAN}=== HackerOne Program Fetcher ==={Style.RESET_ALL}")
     
+    # Consultas sobre snapshots não precisam buscar o índice
+    if args.snapshots:
+        list_snapshots()
+        return
+    if args.snapshot_diff:
+        diff_snapshots(*args.snapshot_diff)
+        return
+
+    # O merge combina fragmentos já gerados, sem buscar o índice
+    if args.mode == 'merge':
+        if merge_shard_fragments(args.sort_by == 'launch'):
+            print(f"\n{Fore.GREEN}Operação concluída!{Style.RESET_ALL}")
+        return
+
+    if args.shard and args.mode not in ('all', 'rewards'):
+        print(f"{Fore.RED}Erro: --shard só pode ser usado com os modos all e rewards.{Style.RESET_ALL}")
+        return
+    if args.run_id and not args.shard:
+        print(f"{Fore.RED}Erro: --run-id só pode ser usado com --shard.{Style.RESET_ALL}")
+        return
+    if args.time_budget is not None and args.mode not in ('all', 'rewards'):
+        print(f"{Fore.RED}Erro: --time-budget só pode ser usado com os modos all e rewards.{Style.RESET_ALL}")
+        return
+
+    # Manutenção do cache também trabalha apenas com dados locais
+    if args.cache_stats:
+        show_cache_stats(args.cache_max_size, args.cache_max_age)
+        return
+    if args.cache_gc:
+        run_cache_gc(args.cache_max_size, args.cache_max_age)
+        return
+
     # Obtendo os dados
-    data = fetch_programs()
+    if args.snapshot:
+        entry = find_snapshot(args.snapshot)
+        if not entry:
+            print(f"{Fore.RED}Erro: Nenhum snapshot encontrado até {args.snapshot}.{Style.RESET_ALL}")
+            return
+        print(f"{Fore.CYAN}Usando snapshot de {entry['fetched_at']} ({entry['sha256'][:12]}){Style.RESET_ALL}")
+        data = load_snapshot(entry["sha256"])
+    else:
+        data = fetch_programs()
     if not data:
         return
 
@@ -819,33 +2214,46 @@ def main():
         display_program_scope(args.scope, data)
         return
 
+    # Modo serve: mantém o índice em memória e responde consultas via HTTP
+    if args.mode == 'serve':
+        serve_api(data, args.host, args.port, args.serve_cache_size)
+        return
+
+    # Número de processos para download, extração e comparação (0 = todos os núcleos)
+    cpu_workers = args.cpu_workers or os.cpu_count() or 1
+    
     # Filtrando programas da HackerOne
     only_rewards = args.mode == 'rewards' or (args.mode.startswith('top') and not args.all)
     
-    # Determina o número de programas a serem exibidos
-    top_count = None
-    if args.mode.startswith('top'):
-        top_count = int(args.mode[3:])
-    
-    hackerone_programs = filter_hackerone_rewards(data, only_rewards, top_count, args.program)
-    
-    if not hackerone_programs:
-        print(f"{Fore.RED}Nenhum programa da HackerOne encontrado.{Style.RESET_ALL}")
-        return
-
     # Modo de operação
     if args.mode.startswith('top'):
         # Extrai o número do modo (top10, top20, etc.)
         count = int(args.mode[3:])
+        hackerone_programs = filter_hackerone_rewards(data, only_rewards, count, args.program, emitter, cpu_workers)
+        
+        if not hackerone_programs:
+            print(f"{Fore.RED}Nenhum programa da HackerOne encontrado.{Style.RESET_ALL}")
+            return
+        
         display_top_programs(hackerone_programs, count, only_rewards)
     else:
-        # Modo padrão: salvar todos os programas por ano
-        # Ordenando por data
-        use_launch_date = args.sort_by == 'launch'
-        sorted_programs = sort_by_date(hackerone_programs, use_launch_date)
+        # Programas pendentes da execução anterior são processados primeiro
+        pending_file = pending_file_path(args.shard)
+        schedule = RunSchedule(args.priority, args.time_budget, load_pending(pending_file))
         
-        # Salvando e exibindo os programas organizados por ano
-        save_programs_by_year(sorted_programs)
+        if args.shard:
+            # Modo distribuído: apenas os programas deste shard, combinados depois pelo modo merge
+            shard, count = args.shard
+            found = stream_programs_to_shard(data, shard, count, only_rewards, args.program, emitter, cpu_workers, schedule, args.run_id)
+        else:
+            # Modo padrão: processar os programas em fluxo e salvar por ano
+            use_launch_date = args.sort_by == 'launch'
+            found = stream_programs_by_year(data, only_rewards, args.program, use_launch_date, emitter, cpu_workers, schedule)
+        
+        save_pending(pending_file, schedule, data)
+        if not found:
+            print(f"{Fore.RED}Nenhum programa da HackerOne encontrado.{Style.RESET_ALL}")
+            return
     
     print(f"\n{Fore.GREEN}Operação concluída!{Style.RESET_ALL}")
 